@@ -1,8 +1,24 @@
+import sys
+
+# Attribute names are interned explicitly, so getattr() lookups can always
+# compare them by identity
+
 # Those will be added to the registered validator methods
-ASYNC_FIELD_VALIDATOR_CONFIG_KEY = 'pydantic_async_field_validator_config'
-ASYNC_MODEL_VALIDATOR_CONFIG_KEY = 'pydantic_async_model_validator_config'
+ASYNC_FIELD_VALIDATOR_CONFIG_KEY = sys.intern('pydantic_async_field_validator_config')
+ASYNC_MODEL_VALIDATOR_CONFIG_KEY = sys.intern('pydantic_async_model_validator_config')
 
 # Those will be added to the pydantic model as class vars
 # (MUST match names used in mixins.py!)
-ASYNC_FIELD_VALIDATORS_KEY = "pydantic_model_async_field_validators"
-ASYNC_MODEL_VALIDATORS_KEY = "pydantic_model_async_model_validators"
+ASYNC_FIELD_VALIDATORS_KEY = sys.intern("pydantic_model_async_field_validators")
+ASYNC_MODEL_VALIDATORS_KEY = sys.intern("pydantic_model_async_model_validators")
+ASYNC_FIELD_VALIDATOR_CALLS_KEY = sys.intern("pydantic_model_async_field_validator_calls")
+ASYNC_FIELD_VALIDATOR_TASKS_KEY = sys.intern("pydantic_model_async_field_validator_tasks")
+ASYNC_CHILD_VALIDATION_PLAN_KEY = sys.intern("pydantic_model_async_child_validation_plan")
+ASYNC_HAS_VALIDATION_KEY = sys.intern("pydantic_model_async_has_validation")
+
+# Kinds of fields which may contain child models, used in the child validation plan
+# (those are compared by identity, so always use the constants!)
+ASYNC_CHILD_KIND_MODEL = sys.intern("model")  # Field is a child model
+ASYNC_CHILD_KIND_SEQUENCE = sys.intern("sequence")  # Field is a list/set/tuple of child models
+ASYNC_CHILD_KIND_MAPPING = sys.intern("mapping")  # Field is a dict with child models as values
+ASYNC_CHILD_KIND_ANY = sys.intern("any")  # Field type cannot be determined, needs runtime checks
@@ -1,33 +1,12 @@
-from collections.abc import Generator
-from contextlib import contextmanager
-from typing import Optional, Union
+from contextlib import ContextDecorator
+from types import TracebackType
+from typing import Any, Optional, Union
 
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
-from pydantic_core import ErrorDetails
-
-
-def _prefix_request_errors(
-    prefix: tuple[Union[int, str], ...],
-    errors: list[ErrorDetails],
-) -> list[ErrorDetails]:
-    """Add prefix to errors in preparation for request validation error conversion."""
-
-    return [
-        {
-            **error,
-            # Just add prefix
-            'loc': (*prefix, *error.get('loc', [])),
-        }
-        for error
-        in errors
-    ]
-
-
-@contextmanager
-def ensure_request_validation_errors(
-    prefix: Optional[Union[tuple[Union[int, str], ...], str]] = None,
-) -> Generator[None, None, None]:
+
+
+class ensure_request_validation_errors(ContextDecorator):
     """
     Converter for `ValidationError` to `RequestValidationError`.
 
@@ -44,19 +23,69 @@ def ensure_request_validation_errors(
     with ensure_request_validation_errors():
         some_code_doing_extra_validation()  # for example async validation
     ```
+
+    Pass `minimal=True` to leave out the input and context of the errors,
+    which avoids converting possibly large input data for the response.
     """
 
-    try:
-        yield
-    except ValidationError as O_o:
-        prepared_errors = O_o.errors(include_url=False)
+    prefix: Optional[tuple[Union[int, str], ...]]
+    minimal: bool
+
+    def __init__(
+        self,
+        prefix: Optional[Union[tuple[Union[int, str], ...], str]] = None,
+        *,
+        minimal: bool = False,
+    ) -> None:
+        self.minimal = minimal
+        # Normalize prefix once, not when handling errors
+        if isinstance(prefix, str):
+            self.prefix = (prefix,)
+        elif prefix is not None:
+            self.prefix = tuple(prefix)
+        else:
+            self.prefix = None
 
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if not isinstance(exc_value, ValidationError):
+            return
+
+        errors: list[Any]
+        if self.minimal:
+            try:
+                errors = exc_value.errors(
+                    include_url=False,
+                    include_context=False,
+                    include_input=False,
+                )
+            except TypeError:
+                # include_input is only supported since pydantic 2.4
+                errors = [
+                    {key: value for key, value in error.items() if key != 'input'}
+                    for error
+                    in exc_value.errors(include_url=False, include_context=False)
+                ]
+        else:
+            errors = exc_value.errors(include_url=False)
+
+        prefix = self.prefix
         if prefix is None:
-            raise RequestValidationError(errors=prepared_errors) from O_o
+            raise RequestValidationError(errors=errors) from exc_value
 
-        if isinstance(prefix, str):
-            prefix = (prefix,)
+        # pydantic-core always provides "loc" as a tuple, so we can just concat
+        prefixed_errors: list[dict[str, Any]] = []
+        append = prefixed_errors.append
+        for error in errors:
+            prefixed_error: dict[str, Any] = dict(error)
+            prefixed_error['loc'] = prefix + error['loc']
+            append(prefixed_error)
 
-        raise RequestValidationError(
-            errors=_prefix_request_errors(prefix, prepared_errors),
-        ) from O_o
+        raise RequestValidationError(errors=prefixed_errors) from exc_value
@@ -1,18 +1,104 @@
-from typing import TYPE_CHECKING, Any, Optional
+import types
+from collections.abc import Iterable, Mapping
+from itertools import chain
+from typing import TYPE_CHECKING, Annotated, Any, Literal, Optional, Union, get_args, get_origin
 
+from pydantic import BaseModel
 from pydantic._internal._model_construction import ModelMetaclass
 
 from pydantic_async_validation.constants import (
+    ASYNC_CHILD_KIND_ANY,
+    ASYNC_CHILD_KIND_MAPPING,
+    ASYNC_CHILD_KIND_MODEL,
+    ASYNC_CHILD_KIND_SEQUENCE,
+    ASYNC_CHILD_VALIDATION_PLAN_KEY,
+    ASYNC_FIELD_VALIDATOR_CALLS_KEY,
     ASYNC_FIELD_VALIDATOR_CONFIG_KEY,
+    ASYNC_FIELD_VALIDATOR_TASKS_KEY,
     ASYNC_FIELD_VALIDATORS_KEY,
+    ASYNC_HAS_VALIDATION_KEY,
     ASYNC_MODEL_VALIDATOR_CONFIG_KEY,
     ASYNC_MODEL_VALIDATORS_KEY,
 )
+from pydantic_async_validation.utils import make_field_validator_tasks_function
 
 if TYPE_CHECKING:  # pragma: no cover
     from pydantic_async_validation.validators import ValidationInfo
 
 
+_UNION_TYPES: tuple[Any, ...] = (
+    (Union, types.UnionType)
+    if hasattr(types, 'UnionType')
+    else (Union,)
+)
+
+
+def _get_child_kind(annotation: Any) -> Optional[str]:
+    """
+    Get the kind of child models a field using the passed annotation may contain.
+
+    Returns `None` if the field can never contain any child models using async
+    validation. Returns `ASYNC_CHILD_KIND_ANY` if this cannot be decided by only
+    looking at the annotation, runtime checks are necessary then.
+    """
+
+    origin = get_origin(annotation)
+
+    # Plain classes
+    if origin is None:
+        if annotation is Any or not isinstance(annotation, type):
+            # Any, TypeVar, ForwardRef, ...
+            return ASYNC_CHILD_KIND_ANY
+        if isinstance(annotation, AsyncValidationModelMetaclass):
+            return ASYNC_CHILD_KIND_MODEL
+        if issubclass(annotation, (str, bytes, bytearray)):
+            # Iterable, but never containing child models
+            return None
+        if (
+            issubclass(annotation, (BaseModel, Iterable, Mapping))
+            or annotation is object
+        ):
+            # May still contain child models (subclasses, untyped containers)
+            return ASYNC_CHILD_KIND_ANY
+        return None
+
+    args = get_args(annotation)
+    if not args:
+        # Bare generics like typing.List / typing.Dict, items may be anything
+        return ASYNC_CHILD_KIND_ANY
+    if origin is Annotated:
+        return _get_child_kind(args[0])
+    if origin is Literal:
+        return None
+
+    arg_kinds = {
+        _get_child_kind(arg)
+        for arg
+        in args
+        if arg is not Ellipsis and arg is not type(None)
+    } - {None}
+
+    # Optional[...] / Union[...]
+    if origin in _UNION_TYPES:
+        if not arg_kinds:
+            return None
+        if len(arg_kinds) == 1:
+            return arg_kinds.pop()
+        return ASYNC_CHILD_KIND_ANY
+
+    # Generic containers like list[...] / dict[...]
+    if isinstance(origin, type) and issubclass(origin, dict):
+        # Only dict values will be validated
+        if _get_child_kind(args[-1]) is None:
+            return None
+        return ASYNC_CHILD_KIND_MAPPING
+    if not arg_kinds:
+        return None
+    if isinstance(origin, type) and issubclass(origin, (list, set, tuple)):
+        return ASYNC_CHILD_KIND_SEQUENCE
+    return ASYNC_CHILD_KIND_ANY
+
+
 class AsyncValidationModelMetaclass(ModelMetaclass):
     def __new__(
         mcs,
@@ -21,26 +107,15 @@ class AsyncValidationModelMetaclass(ModelMetaclass):
         namespace: dict[str, Any],
         **kwargs: Any,
     ) -> Any:
-        async_field_validators: list[tuple[list[str], ValidationInfo]] = []
-        async_model_validators: list[ValidationInfo] = []
+        own_async_field_validators: list[tuple[tuple[str, ...], ValidationInfo]] = []
+        own_async_model_validators: list[ValidationInfo] = []
 
-        async_field_validator_fields: Optional[list[str]]
+        async_field_validator_fields: Optional[tuple[str, ...]]
         async_field_validator_config: Optional[ValidationInfo]
         async_model_validator_config: Optional[ValidationInfo]
 
-        for base in bases:
-            async_field_validators += getattr(
-                base,
-                ASYNC_FIELD_VALIDATORS_KEY,
-                [],
-            )
-            async_model_validators += getattr(
-                base,
-                ASYNC_MODEL_VALIDATORS_KEY,
-                [],
-            )
-
-        for _attr_name, attr_value in namespace.items():
+        # Only one attribute lookup per key, the defaults work as sentinels
+        for attr_value in namespace.values():
             # Register all field validators
             async_field_validator_fields, async_field_validator_config = getattr(
                 attr_value,
@@ -52,7 +127,9 @@ class AsyncValidationModelMetaclass(ModelMetaclass):
                 and async_field_validator_config is not None
                 and callable(async_field_validator_config.func)
             ):
-                async_field_validators.append(attr_value)
+                own_async_field_validators.append(
+                    (async_field_validator_fields, async_field_validator_config),
+                )
 
             # Register all model validators
             async_model_validator_config = getattr(
@@ -64,9 +141,76 @@ class AsyncValidationModelMetaclass(ModelMetaclass):
                 async_model_validator_config is not None
                 and callable(async_model_validator_config.func)
             ):
-                async_model_validators.append(attr_value)
+                own_async_model_validators.append(async_model_validator_config)
+
+        if not own_async_field_validators and not own_async_model_validators and len(bases) == 1:
+            # Fast path: Class is not adding any validators, so we can just
+            # reuse the (immutable) validators of its only base
+            namespace[ASYNC_FIELD_VALIDATORS_KEY] = getattr(bases[0], ASYNC_FIELD_VALIDATORS_KEY, ())
+            namespace[ASYNC_MODEL_VALIDATORS_KEY] = getattr(bases[0], ASYNC_MODEL_VALIDATORS_KEY, ())
+            namespace[ASYNC_FIELD_VALIDATOR_CALLS_KEY] = getattr(bases[0], ASYNC_FIELD_VALIDATOR_CALLS_KEY, ())
+            base_field_validator_tasks = getattr(bases[0], ASYNC_FIELD_VALIDATOR_TASKS_KEY, None)
+            if base_field_validator_tasks is not None:
+                namespace[ASYNC_FIELD_VALIDATOR_TASKS_KEY] = staticmethod(base_field_validator_tasks)
+        else:
+            # Bases already did resolve all their validators (including the ones
+            # of their own bases), so we only need to look at the direct bases
+            async_field_validators = (
+                *chain.from_iterable(
+                    getattr(base, ASYNC_FIELD_VALIDATORS_KEY, ())
+                    for base
+                    in bases
+                ),
+                *own_async_field_validators,
+            )
+            async_model_validators = (
+                *chain.from_iterable(
+                    getattr(base, ASYNC_MODEL_VALIDATORS_KEY, ())
+                    for base
+                    in bases
+                ),
+                *own_async_model_validators,
+            )
+
+            # Store resolved validators as tuples, those will never change after
+            # class creation and are iterated on every validation run
+            namespace[ASYNC_FIELD_VALIDATORS_KEY] = async_field_validators
+            namespace[ASYNC_MODEL_VALIDATORS_KEY] = async_model_validators
+
+            # Flatten field validators to one (field_name, validator) pair per
+            # call, so validation does not need to loop over field names
+            namespace[ASYNC_FIELD_VALIDATOR_CALLS_KEY] = tuple(
+                (field_name, field_validator)
+                for field_names, field_validator
+                in async_field_validators
+                for field_name
+                in field_names
+            )
+
+        if ASYNC_FIELD_VALIDATOR_TASKS_KEY not in namespace:
+            # Generate the code starting all field validators once per class
+            namespace[ASYNC_FIELD_VALIDATOR_TASKS_KEY] = staticmethod(
+                make_field_validator_tasks_function(namespace[ASYNC_FIELD_VALIDATOR_CALLS_KEY]),
+            )
+
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+
+        # Only fields possibly containing child models need to be checked when
+        # doing recursive validation, collect those once
+        child_validation_plan: list[tuple[str, str]] = []
+        for field_name, field_info in cls.model_fields.items():
+            child_kind = _get_child_kind(field_info.annotation)
+            if child_kind is not None:
+                child_validation_plan.append((field_name, child_kind))
+        setattr(cls, ASYNC_CHILD_VALIDATION_PLAN_KEY, tuple(child_validation_plan))
 
-        namespace[ASYNC_FIELD_VALIDATORS_KEY] = async_field_validators
-        namespace[ASYNC_MODEL_VALIDATORS_KEY] = async_model_validators
+        # Instances of classes without any validators and without possible
+        # children don't need to be validated as child models at all
+        has_validation = bool(
+            namespace[ASYNC_FIELD_VALIDATOR_CALLS_KEY]
+            or namespace[ASYNC_MODEL_VALIDATORS_KEY]
+            or child_validation_plan,
+        )
+        setattr(cls, ASYNC_HAS_VALIDATION_KEY, has_validation)
 
-        return super().__new__(mcs, name, bases, namespace, **kwargs)
+        return cls
@@ -1,16 +1,16 @@
-from typing import ClassVar, Union
+from typing import Any, Callable, ClassVar, Union
 
 import pydantic
-from pydantic_core import InitErrorDetails, PydanticCustomError, ValidationError
+from pydantic_core import InitErrorDetails, ValidationError
 
 from pydantic_async_validation.constants import (
-    ASYNC_FIELD_VALIDATOR_CONFIG_KEY,
-    ASYNC_FIELD_VALIDATORS_KEY,
-    ASYNC_MODEL_VALIDATOR_CONFIG_KEY,
-    ASYNC_MODEL_VALIDATORS_KEY,
+    ASYNC_CHILD_KIND_ANY,
+    ASYNC_CHILD_KIND_MAPPING,
+    ASYNC_CHILD_KIND_MODEL,
+    ASYNC_CHILD_KIND_SEQUENCE,
 )
 from pydantic_async_validation.metaclasses import AsyncValidationModelMetaclass
-from pydantic_async_validation.utils import prefix_errors
+from pydantic_async_validation.utils import gather_results, make_prefixed_error_collector, prefix_errors
 from pydantic_async_validation.validators import ValidationInfo
 
 
@@ -19,8 +19,17 @@ class AsyncValidationModelMixin(
     metaclass=AsyncValidationModelMetaclass,
 ):
     # MUST match names defined in constants.py!
-    pydantic_model_async_field_validators: ClassVar[list[tuple[list[str], ValidationInfo]]]
-    pydantic_model_async_model_validators: ClassVar[list[ValidationInfo]]
+    pydantic_model_async_field_validators: ClassVar[tuple[tuple[tuple[str, ...], ValidationInfo], ...]]
+    pydantic_model_async_model_validators: ClassVar[tuple[ValidationInfo, ...]]
+    pydantic_model_async_field_validator_calls: ClassVar[tuple[tuple[str, ValidationInfo], ...]]
+    pydantic_model_async_field_validator_tasks: ClassVar[
+        Callable[[Any], list[tuple[str, Any, ValidationInfo, Any]]]
+    ]
+    pydantic_model_async_child_validation_plan: ClassVar[tuple[tuple[str, str], ...]]
+    pydantic_model_async_has_validation: ClassVar[bool]
+
+    # Set to True to run validators one after another, useful for debugging
+    pydantic_model_async_validate_sequential: ClassVar[bool] = False
 
     async def model_async_validate(self) -> None:
         """
@@ -28,100 +37,150 @@ class AsyncValidationModelMixin(
 
         Will call all async field and async model validators. All errors will be
         collected and raised as a `ValidationError` exception.
+
+        Validators are run concurrently using `asyncio.gather()`, so validators
+        doing I/O (like database lookups) will not block each other. Model
+        validators are run after all field validators did finish, child models
+        are validated after that. Set `pydantic_model_async_validate_sequential`
+        to `True` on your model to run validators one after another instead.
         """
-        field_names: list[str]
-        field_validator: ValidationInfo
-        model_validator: ValidationInfo
-
-        validation_errors = []
-        field_validators = getattr(self, ASYNC_FIELD_VALIDATORS_KEY, [])
-        model_validators = getattr(self, ASYNC_MODEL_VALIDATORS_KEY, [])
-
-        # Call all field validators
-        for field_validator_attr in field_validators:
-            field_names, field_validator = getattr(
-                field_validator_attr,
-                ASYNC_FIELD_VALIDATOR_CONFIG_KEY,
+        validation_errors = await self._model_async_validation_errors(())
+
+        # If some errors did occur, raise them as a ValidationError
+        if validation_errors:
+            raise ValidationError.from_exception_data(
+                self.__class__.__name__,
+                validation_errors,
             )
-            for field_name in field_names:
-                try:
-                    await field_validator.func(
-                        self,
-                        getattr(self, field_name, None),
-                        field_name,
-                        field_validator,
-                    )
-                except (ValueError, AssertionError) as o_O:
-                    validation_errors.append(
-                        InitErrorDetails(
-                            type=PydanticCustomError('value_error', str(o_O)),  # type: ignore
-                            loc=(field_name,),
-                            input=getattr(self, field_name, None),
-                        ),
-                    )
 
-        # Call all model validators
-        for model_validator_attr in model_validators:
-            model_validator = getattr(
-                model_validator_attr,
-                ASYNC_MODEL_VALIDATOR_CONFIG_KEY,
+    async def _model_async_validation_errors(
+        self,
+        prefix: tuple[Union[int, str], ...],
+    ) -> list[InitErrorDetails]:
+        """
+        Run async validation for the model instance and return all errors.
+
+        Error locations will be prefixed using `prefix`. Child models are
+        validated using their prefix directly, so errors are only created once
+        and not converted again for every level of nesting.
+        """
+        validation_errors: list[InitErrorDetails] = []
+        collect_error = make_prefixed_error_collector(prefix, validation_errors)
+        cls = type(self)
+
+        # Call all field validators, see `make_field_validator_tasks_function()`
+        field_validator_tasks = cls.pydantic_model_async_field_validator_tasks(self)
+        if field_validator_tasks:
+            field_validator_results = await gather_results(
+                [task for _, _, _, task in field_validator_tasks],
+                sequential=cls.pydantic_model_async_validate_sequential,
             )
-            try:
-                await model_validator.func(
-                    self,
-                    model_validator,
-                )
-            except (ValueError, AssertionError) as o_O:
-                validation_errors.append(
-                    InitErrorDetails(
-                        type=PydanticCustomError('value_error', str(o_O)),  # type: ignore
-                        loc=('__root__',),
-                        input=self.__dict__,
-                    ),
-                )
+            for task_details, result in zip(field_validator_tasks, field_validator_results):
+                field_name, field_value, field_validator, _ = task_details
+                if isinstance(result, (ValueError, AssertionError)):
+                    collect_error((field_name,), field_value, result)
+                elif isinstance(result, BaseException):
+                    raise result
+                elif result is not None and not field_validator.raises_on_error:
+                    # Validator returned an error message
+                    collect_error((field_name,), field_value, result)
 
-        # Also call async validation on attribute values
-        async def extend_with_validation_errors_by(
-            prefix: tuple[Union[int, str], ...],
-            instance: AsyncValidationModelMixin,
-        ) -> None:
+        # Call all model validators
+        model_validators = cls.pydantic_model_async_model_validators
+        model_validator_tasks: list[Any] = []
+        for model_validator in model_validators:
             try:
-                await instance.model_async_validate()
-            except ValidationError as O_o:
-                validation_errors.extend(
-                    prefix_errors(
-                        prefix,
-                        O_o.errors(),
+                model_validator_tasks.append(
+                    model_validator.func(
+                        self,
+                        model_validator,
                     ),
                 )
+            except Exception as O_o:
+                # Sync validator did raise, use the exception as its result
+                model_validator_tasks.append(O_o)
 
-        for attribute_name, attribute_value in self.__dict__.items():
+        if model_validator_tasks:
+            model_validator_results = await gather_results(
+                model_validator_tasks,
+                sequential=cls.pydantic_model_async_validate_sequential,
+            )
+            for model_validator, result in zip(model_validators, model_validator_results):
+                if isinstance(result, (ValueError, AssertionError)):
+                    collect_error(('__root__',), self.__dict__, result)
+                elif isinstance(result, BaseException):
+                    raise result
+                elif result is not None and not model_validator.raises_on_error:
+                    # Validator returned an error message
+                    collect_error(('__root__',), self.__dict__, result)
+
+        # Also call async validation on attribute values, only fields possibly
+        # containing child models are part of the child validation plan. Field
+        # values are read from the instance dict directly, kinds are compared by
+        # identity as the plan always uses the constants.
+        instance_dict = self.__dict__
+        child_tasks: list[tuple[tuple[Union[int, str], ...], AsyncValidationModelMixin]] = []
+        for attribute_name, child_kind in cls.pydantic_model_async_child_validation_plan:
+            attribute_value = instance_dict.get(attribute_name)
+            check_all_kinds = child_kind is ASYNC_CHILD_KIND_ANY
             # Direct child instance
-            if isinstance(attribute_value, AsyncValidationModelMixin):
-                await extend_with_validation_errors_by(
-                    (attribute_name,),
-                    attribute_value,
-                )
+            if check_all_kinds or child_kind is ASYNC_CHILD_KIND_MODEL:
+                if isinstance(attribute_value, AsyncValidationModelMixin) and _needs_validation(attribute_value):
+                    child_tasks.append(((*prefix, attribute_name), attribute_value))
             # List of child instances
-            if isinstance(attribute_value, (list, set, tuple)):
-                for index, item in enumerate(attribute_value):
-                    if isinstance(item, AsyncValidationModelMixin):
-                        await extend_with_validation_errors_by(
-                            (attribute_name, index),
-                            item,
-                        )
+            if check_all_kinds or child_kind is ASYNC_CHILD_KIND_SEQUENCE:
+                if isinstance(attribute_value, (list, set, tuple)):
+                    for index, item in enumerate(attribute_value):
+                        if isinstance(item, AsyncValidationModelMixin) and _needs_validation(item):
+                            child_tasks.append(((*prefix, attribute_name, index), item))
             # Dict of child instances
-            if isinstance(attribute_value, dict):
-                for key, item in attribute_value.items():
-                    if isinstance(item, AsyncValidationModelMixin):
-                        await extend_with_validation_errors_by(
-                            (attribute_name, key),
-                            item,
-                        )
+            if check_all_kinds or child_kind is ASYNC_CHILD_KIND_MAPPING:
+                if isinstance(attribute_value, dict):
+                    for key, item in attribute_value.items():
+                        if isinstance(item, AsyncValidationModelMixin) and _needs_validation(item):
+                            child_tasks.append(((*prefix, attribute_name, key), item))
 
-        # If some errors did occur, raise them as a ValidationError
-        if len(validation_errors) > 0:
-            raise ValidationError.from_exception_data(
-                self.__class__.__name__,
-                validation_errors,
+        if child_tasks:
+            child_results = await gather_results(
+                [
+                    _child_validation_errors(child_prefix, instance)
+                    for child_prefix, instance
+                    in child_tasks
+                ],
+                sequential=cls.pydantic_model_async_validate_sequential,
             )
+            for result in child_results:
+                if isinstance(result, BaseException):
+                    raise result
+                # Keep errors in child order, even when validated concurrently
+                validation_errors.extend(result)
+
+        return validation_errors
+
+
+def _needs_validation(instance: AsyncValidationModelMixin) -> bool:
+    """Check whether validating a child model may return any errors at all."""
+
+    cls = type(instance)
+    return (
+        cls.pydantic_model_async_has_validation
+        or cls.model_async_validate is not AsyncValidationModelMixin.model_async_validate
+    )
+
+
+async def _child_validation_errors(
+    prefix: tuple[Union[int, str], ...],
+    instance: AsyncValidationModelMixin,
+) -> list[InitErrorDetails]:
+    """Validate a child model, returning its errors using the passed prefix."""
+
+    if type(instance).model_async_validate is AsyncValidationModelMixin.model_async_validate:
+        return await instance._model_async_validation_errors(prefix)
+
+    # Child did override `model_async_validate()`, so we need to call it and
+    # convert its errors afterwards
+    try:
+        await instance.model_async_validate()
+    except ValidationError as exc:
+        return prefix_errors(prefix, exc.errors())
+    return []
@@ -1,164 +1,219 @@
-from functools import wraps
-from inspect import Signature, signature
-from typing import Callable, Union, cast
+import asyncio
+from collections.abc import Coroutine
+from inspect import CO_VARARGS, CO_VARKEYWORDS, Parameter, signature
+from itertools import takewhile
+from typing import Any, Callable, Union
 
 from pydantic import PydanticUserError
 from pydantic_core import ErrorDetails, InitErrorDetails, PydanticCustomError
 
+_validator_wrapper_factories: dict[
+    tuple[tuple[str, ...], tuple[str, ...], int],
+    Callable[[Callable], Callable],
+] = {}
 
-def make_generic_field_validator(validator_func: Callable) -> Callable:
-    """
-    Make a generic function which calls a field validator with the right arguments.
+
+def get_validator_wrapper_factory(
+    wrapper_args: tuple[str, ...],
+    positional_args: tuple[str, ...],
+    keyword_args_mask: int,
+) -> Callable[[Callable], Callable]:
     """
+    Return a factory creating wrappers which call a validator with only the arguments it defines.
 
-    sig = signature(validator_func)
-    args = list(sig.parameters.keys())
-    first_arg = args.pop(0)
-    if first_arg == 'cls':
-        raise PydanticUserError(
-            f'Invalid signature for validator {validator_func}: {sig},'
-            f'"cls" not permitted as first argument, '
-            f'should be: (self, value, field, config), '
-            f'"value", "field" and "config" are all optional.',
-            code='validator-signature',
-        )
-    return wraps(validator_func)(
-        generic_field_validator_wrapper(
-            validator_func,
-            sig,
-            set(args),
-        ),
-    )
+    The wrapper accepts all `wrapper_args` (after `self`) and passes only the
+    `positional_args` (in this order) and the arguments selected by
+    `keyword_args_mask` (as keyword arguments) to the validator. Bit `n` of
+    the mask selects `wrapper_args[n]`. The code for the factory is generated
+    once per combination of arguments and then reused, so calling the wrapper
+    does not need any argument dispatching at runtime.
+    """
 
+    cache_key = (wrapper_args, positional_args, keyword_args_mask)
+    try:
+        return _validator_wrapper_factories[cache_key]
+    except KeyError:
+        pass
 
-all_field_validator_kwargs = {'value', 'field', 'config'}
+    call_args = ''.join(
+        f', {arg}'
+        for arg
+        in positional_args
+    )
+    call_kwargs = ''.join(
+        f', {arg}={arg}'
+        for index, arg
+        in enumerate(wrapper_args)
+        if keyword_args_mask & (1 << index)
+    )
+    source = (
+        f'def make_wrapper(validator_func):\n'
+        f'    def wrapper(self, {", ".join(wrapper_args)}):\n'
+        f'        return validator_func(self{call_args}{call_kwargs})\n'
+        f'    return wrapper\n'
+    )
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)  # noqa: S102
+    factory = namespace['make_wrapper']
+    _validator_wrapper_factories[cache_key] = factory
+    return factory
 
 
-def generic_field_validator_wrapper(
-    validator_func: Callable,
-    sig: 'Signature',
-    args: set[str],
-) -> Callable:
+def make_field_validator_tasks_function(
+    field_validator_calls: tuple[tuple[str, Any], ...],
+) -> Callable[[Any], list[tuple[str, Any, Any, Any]]]:
     """
-    Return a helper function to wrap a method to be called with its defined parameters.
+    Create a function starting all field validators for a model instance.
+
+    The function returns a `(field_name, field_value, validator, coroutine)`
+    tuple for every call in `field_validator_calls`. If calling the validator
+    does raise an exception already (sync validators), the exception is used
+    instead of the coroutine. Its code is generated once per model class and
+    contains all calls straight-line, so validation does not need to loop over
+    the validators or look up the validator functions at runtime.
     """
-    # assume the first argument is value
-    has_kwargs = False
-    if 'kwargs' in args:
-        has_kwargs = True
-        args -= {'kwargs'}
 
-    if not args.issubset(all_field_validator_kwargs):
-        raise PydanticUserError(
-            f'Invalid signature for validator {validator_func}: {sig}, '
-            f'should be: '
-            f'(self, value, field, config), '
-            f'"value", "field" and "config" are all optional.',
-            code='validator-signature',
+    namespace: dict[str, Any] = {}
+    lines = ['def create_field_validator_tasks(self):']
+    tasks = []
+    for index, (field_name, field_validator) in enumerate(field_validator_calls):
+        # Only pass values using the namespace, never put them into the code
+        namespace[f'name_{index}'] = str(field_name)
+        namespace[f'validator_{index}'] = field_validator
+        namespace[f'func_{index}'] = field_validator.func
+        lines.extend((
+            # Fetch value once, it is also used as input for errors
+            f'    value_{index} = getattr(self, name_{index}, None)',
+            '    try:',
+            f'        task_{index} = func_{index}(self, value_{index}, name_{index}, validator_{index})',
+            '    except Exception as exc:',
+            f'        task_{index} = exc',
+        ))
+        tasks.append(
+            f'        (name_{index}, value_{index}, validator_{index}, task_{index}),',
         )
+    lines.extend(('    return [', *tasks, '    ]', ''))
+    exec('\n'.join(lines), namespace)  # noqa: S102
+    return namespace['create_field_validator_tasks']
 
-    if has_kwargs:
-        return lambda self, value, field, config: validator_func(
-            self, value=value, field=field, config=config,
-        )
-    if args == set():
-        return lambda self, value, field, config: validator_func(  # noqa: ARG005
-            self,
-        )
-    if args == {'value'}:
-        return lambda self, value, field, config: validator_func(  # noqa: ARG005
-            self, value=value,
-        )
-    if args == {'field'}:
-        return lambda self, value, field, config: validator_func(  # noqa: ARG005
-            self, field=field,
-        )
-    if args == {'value', 'field'}:
-        return lambda self, value, field, config: validator_func(  # noqa: ARG005
-            self, value=value, field=field,
-        )
-    if args == {'config'}:
-        return lambda self, value, field, config: validator_func(  # noqa: ARG005
-            self, config=config,
-        )
-    if args == {'value', 'config'}:
-        return lambda self, value, field, config: validator_func(  # noqa: ARG005
-            self, value=value, config=config,
-        )
-    if args == {'field', 'config'}:
-        return lambda self, value, field, config: validator_func(  # noqa: ARG005
-            self, field=field, config=config,
+
+def get_validator_args(validator_func: Callable) -> tuple[list[str], int]:
+    """
+    Return the names of all arguments the validator function defines.
+
+    Also returns the number of arguments which may be passed positionally,
+    those are always the first ones.
+
+    Reads the arguments from the code object of plain functions, which is
+    way cheaper than using `inspect.signature()`. Other callables and wrapped
+    functions (using `__wrapped__`) still use `inspect.signature()`.
+    """
+
+    code = getattr(validator_func, '__code__', None)
+    if code is None or hasattr(validator_func, '__wrapped__'):
+        parameters = signature(validator_func).parameters.values()
+        return (
+            [parameter.name for parameter in parameters],
+            sum(
+                1
+                for parameter
+                in parameters
+                if parameter.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+            ),
         )
 
-    # args == {'value', 'field', 'config'}
-    return lambda self, value, field, config: validator_func(
-        self, value=value, field=field, config=config,
-    )
+    arg_count = code.co_argcount + code.co_kwonlyargcount
+    if code.co_flags & CO_VARARGS:
+        arg_count += 1
+    if code.co_flags & CO_VARKEYWORDS:
+        arg_count += 1
+    return list(code.co_varnames[:arg_count]), code.co_argcount
 
 
-def make_generic_model_validator(validator_func: Callable) -> Callable:
+def make_generic_validator(
+    validator_func: Callable,
+    wrapper_args: tuple[str, ...],
+    signature_hint: str,
+) -> Callable:
     """
-    Make a generic function which calls a model validator with the right arguments.
+    Make a generic function which calls a validator with the right arguments.
+
+    The returned function must be called with `self` and all `wrapper_args`,
+    the validator will only get passed the arguments it defines.
+    `signature_hint` is used in error messages to show the expected signature.
     """
 
-    sig = signature(validator_func)
-    args = list(sig.parameters.keys())
+    args, positional_count = get_validator_args(validator_func)
+    sig = f'({", ".join(args)})'
     first_arg = args.pop(0)
     if first_arg == 'cls':
         raise PydanticUserError(
             f'Invalid signature for validator {validator_func}: {sig},'
             f'"cls" not permitted as first argument, '
-            f'should be: (self, config), '
-            f'"config" is optional.',
+            f'should be: {signature_hint}.',
             code='validator-signature',
         )
-    return wraps(validator_func)(
-        generic_model_validator_wrapper(
-            validator_func,
-            sig,
-            set(args),
+
+    # Build bit mask of arguments to pass, bit n is set for wrapper_args[n]
+    passed_args_mask = 0
+    for arg in args:
+        if arg == 'kwargs':
+            passed_args_mask |= (1 << len(wrapper_args)) - 1
+        elif arg in wrapper_args:
+            passed_args_mask |= 1 << wrapper_args.index(arg)
+        else:
+            raise PydanticUserError(
+                f'Invalid signature for validator {validator_func}: {sig}, '
+                f'should be: {signature_hint}.',
+                code='validator-signature',
+            )
+
+    # Arguments directly following self are passed positionally, which is
+    # cheaper than using keyword arguments
+    positional_args = tuple(
+        takewhile(
+            lambda arg: arg in wrapper_args,
+            args[:max(positional_count - 1, 0)],
         ),
     )
+    keyword_args_mask = passed_args_mask
+    for arg in positional_args:
+        keyword_args_mask &= ~(1 << wrapper_args.index(arg))
 
-
-all_model_validator_kwargs = {'config'}
+    wrapper = get_validator_wrapper_factory(
+        wrapper_args,
+        positional_args,
+        keyword_args_mask,
+    )(validator_func)
+    # Not using functools.wraps() on purpose, we don't want to set __wrapped__
+    # as the wrapper has a different signature than the validator
+    for attr_name in ('__module__', '__name__', '__qualname__', '__doc__'):
+        if hasattr(validator_func, attr_name):
+            setattr(wrapper, attr_name, getattr(validator_func, attr_name))
+    return wrapper
 
 
-def generic_model_validator_wrapper(
-    validator_func: Callable,
-    sig: 'Signature',
-    args: set[str],
-) -> Callable:
+def make_generic_field_validator(validator_func: Callable) -> Callable:
     """
-    Return a helper function to wrap a method to be called with its defined parameters.
+    Make a generic function which calls a field validator with the right arguments.
     """
-    # assume the first argument is value
-    has_kwargs = False
-    if 'kwargs' in args:
-        has_kwargs = True
-        args -= {'kwargs'}
 
-    if not args.issubset(all_model_validator_kwargs):
-        raise PydanticUserError(
-            f'Invalid signature for validator {validator_func}: {sig}, '
-            f'should be: '
-            f'(self, config), '
-            f'"config" is optional.',
-            code='validator-signature',
-        )
+    return make_generic_validator(
+        validator_func,
+        ('value', 'field', 'config'),
+        '(self, value, field, config), "value", "field" and "config" are all optional',
+    )
 
-    if has_kwargs:
-        return lambda self, config: validator_func(
-            self, config=config,
-        )
-    if args == set():
-        return lambda self, config: validator_func(  # noqa: ARG005
-            self,
-        )
 
-    # args == {'validator'}
-    return lambda self, config: validator_func(
-        self, config=config,
+def make_generic_model_validator(validator_func: Callable) -> Callable:
+    """
+    Make a generic function which calls a model validator with the right arguments.
+    """
+
+    return make_generic_validator(
+        validator_func,
+        ('config',),
+        '(self, config), "config" is optional',
     )
 
 
@@ -173,33 +228,96 @@ def prefix_errors(
     field details in the error locations.
     """
 
-    return [
-        cast(
-            InitErrorDetails,
-            {
-                # Original data is ErrorDetails, we need to convert it back to
-                # InitErrorDetails
-                **error,
-                'type': (
-                    PydanticCustomError(
-                        error['type'],  # type: ignore
-                        cast(ErrorDetails, error)['msg'],  # type: ignore
-                    )
-                    if isinstance(error['type'], str)
-                    else error['type']
-                ),
-                'loc': (*prefix, *error['loc']),
-            },
-        )
-        if "msg" in error
-        else cast(
-            InitErrorDetails,
-            {
-                # Original data is InitErrorDetails, all fine
-                **error,
-                'loc': (*prefix, *error.get('loc', [])),
-            },
-        )
-        for error
-        in errors
-    ]
+    # Local bindings, this runs once for every error
+    custom_error = PydanticCustomError
+    prefixed_errors: list[Any] = []
+    append = prefixed_errors.append
+    for error in errors:
+        # Shallow copy in C and replace only the changed keys
+        prefixed_error: dict[str, Any] = dict(error)
+        prefixed_error['loc'] = (*prefix, *error.get('loc', ()))
+        error_type = prefixed_error['type']
+        if type(error_type) is str and 'msg' in prefixed_error:
+            # Original data is ErrorDetails, we need to convert it back to
+            # InitErrorDetails
+            prefixed_error['type'] = custom_error(error_type, prefixed_error['msg'])  # type: ignore
+        append(prefixed_error)
+    return prefixed_errors
+
+
+def make_prefixed_error_collector(
+    prefix: tuple[Union[int, str], ...],
+    errors: list[InitErrorDetails],
+) -> Callable[[tuple[Union[int, str], ...], Any, object], None]:
+    """
+    Create a callback adding validation errors to the passed list of errors.
+
+    The callback gets passed the error location (relative to `prefix`), the
+    input value and the error (exception or error message). Errors are created
+    using the full location right away, so no second pass using
+    `prefix_errors()` is necessary.
+    """
+
+    custom_error = PydanticCustomError
+    append = errors.append
+
+    def collect_error(
+        loc: tuple[Union[int, str], ...],
+        input_value: Any,
+        error: object,
+    ) -> None:
+        append(InitErrorDetails(
+            type=custom_error('value_error', str(error)),  # type: ignore
+            loc=(*prefix, *loc),
+            input=input_value,
+        ))
+
+    return collect_error
+
+
+async def gather_results(
+    tasks: list[Any],
+    *,
+    sequential: bool = False,
+) -> list[Any]:
+    """
+    Run all coroutines and return their results or the exceptions they did raise.
+
+    This behaves like `asyncio.gather(..., return_exceptions=True)`. `tasks` may
+    also contain exceptions (raised when creating the coroutine), those are
+    returned as the result directly. When passing `sequential=True` the
+    coroutines will be awaited one after another instead, which can be useful
+    for debugging.
+
+    `asyncio.gather()` wraps every coroutine in a task, which is way more
+    expensive than awaiting it. So it is only used when there are at least
+    two coroutines which may actually run concurrently.
+    """
+
+    if not sequential:
+        coroutines = [task for task in tasks if not isinstance(task, BaseException)]
+        if len(coroutines) > 1:
+            results = iter(await asyncio.gather(*coroutines, return_exceptions=True))
+            return [
+                task if isinstance(task, BaseException) else next(results)
+                for task
+                in tasks
+            ]
+
+    # Running sequentially or nothing to run concurrently, just await directly
+    results_list: list[Any] = []
+    for index, task in enumerate(tasks):
+        if isinstance(task, BaseException):
+            results_list.append(task)
+            continue
+        try:
+            results_list.append(await task)
+        except Exception as O_o:
+            results_list.append(O_o)
+        except BaseException:
+            # Ensure the remaining coroutines don't trigger "never awaited" warnings
+            for remaining_task in tasks[index + 1:]:
+                if isinstance(remaining_task, Coroutine):
+                    remaining_task.close()
+            raise
+    return results_list
@@ -1,4 +1,5 @@
-from types import FunctionType
+from collections.abc import Mapping
+from types import FunctionType, MappingProxyType
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from pydantic.errors import PydanticUserError
@@ -27,26 +28,40 @@ if TYPE_CHECKING:  # pragma: no cover
     ValidatorListDict = "dict[str, list[Validator]]"
 
 
+# Default for validators created without extra details, read only so it cannot
+# be changed for all those validators by accident
+EMPTY_EXTRA: Mapping[str, Any] = MappingProxyType({})
+
+
 class ValidationInfo:
-    """Helper / data class to store validator information."""
+    """
+    Helper / data class to store validator information.
+
+    Note `extra` defaults to the shared read only `EMPTY_EXTRA` mapping when
+    not passed, validators created using the decorators always get a `dict`.
+    """
+
+    __slots__ = ('extra', 'func', 'raises_on_error')
 
-    __slots__ = ('extra', 'func')
+    extra: Mapping[str, Any]
 
     def __init__(
         self,
         func: Callable,
         *,
-        extra: Optional[dict[str, Any]] = None,
-
+        extra: Optional[Mapping[str, Any]] = EMPTY_EXTRA,
+        raises_on_error: bool = True,
     ) -> None:
         self.func = func
-        self.extra = extra if extra is not None else {}
+        self.extra = EMPTY_EXTRA if extra is None else extra
+        self.raises_on_error = raises_on_error
 
 
 def async_field_validator(
     __field_name: str,
     /,
     *additional_field_names: str,
+    raises_on_error: bool = True,
     **extra: Any,
 ) -> Callable[[Callable], Callable]:
     """
@@ -54,17 +69,37 @@ def async_field_validator(
 
     This decorator allows you to assign your validation
     function to a list of fields.
-    """
 
-    if isinstance(__field_name, FunctionType):
-        raise PydanticUserError(
-            "Validators should be used with fields and keyword arguments, "
-            "not bare. "
-            "E.g. usage should be `@async_field_validator('<field_name>', ...)`",
-            code='validator-instance-method',
-        )
+    When passing `raises_on_error=False` the validator may return an error
+    message instead of raising an exception, returning `None` means the
+    value is valid.
+    """
 
-    field_names: tuple[str, ...] = __field_name, *additional_field_names
+    field_names: tuple[str, ...] = (
+        (__field_name, *additional_field_names)
+        if additional_field_names
+        else (__field_name,)
+    )
+
+    # Field names are nearly always passed as str, so check this first
+    if type(__field_name) is not str or (
+        additional_field_names
+        and not all(type(field_name) is str for field_name in additional_field_names)
+    ):
+        if isinstance(__field_name, FunctionType):
+            raise PydanticUserError(
+                "Validators should be used with fields and keyword arguments, "
+                "not bare. "
+                "E.g. usage should be `@async_field_validator('<field_name>', ...)`",
+                code='validator-instance-method',
+            )
+        if not all(isinstance(field_name, str) for field_name in field_names):
+            raise PydanticUserError(
+                "Validator fields should be passed as separate string arguments. "
+                "E.g. usage should be "
+                "`@async_field_validator('<field_name_1>', '<field_name_2>', ...)`",
+                code='decorator-invalid-fields',
+            )
 
     def dec(func: Callable) -> Callable:
         setattr(
@@ -75,6 +110,7 @@ def async_field_validator(
                 ValidationInfo(
                     func=make_generic_field_validator(func),
                     extra=extra,
+                    raises_on_error=raises_on_error,
                 ),
             ),
         )
@@ -84,6 +120,8 @@ def async_field_validator(
 
 
 def async_model_validator(
+    *,
+    raises_on_error: bool = True,
     **extra: Any,
 ) -> Callable[[Callable], Callable]:
     """
@@ -91,8 +129,13 @@ def async_model_validator(
 
     This decorator allows you to assign your validation
     function to the whole model (root validator).
+
+    When passing `raises_on_error=False` the validator may return an error
+    message instead of raising an exception, returning `None` means the
+    model is valid.
     """
 
+
     def dec(func: Callable) -> Callable:
         setattr(
             func,
@@ -100,6 +143,7 @@ def async_model_validator(
             ValidationInfo(
                 func=make_generic_model_validator(func),
                 extra=extra,
+                raises_on_error=raises_on_error,
             ),
         )
         return func
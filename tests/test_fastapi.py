@@ -5,6 +5,7 @@ from pydantic_async_validation import AsyncValidationModelMixin, async_field_val
 
 try:
     import fastapi
+    from fastapi.exceptions import RequestValidationError
     from fastapi.testclient import TestClient
 
     from pydantic_async_validation.fastapi import ensure_request_validation_errors
@@ -64,3 +65,39 @@ def test_fastapi_triggers_validation_response(app):
     with TestClient(app) as client:
         response = client.get("/with-request-validation-errors")
         assert response.status_code == 422
+
+
+@pytest.mark.skipif(fastapi is None, reason="fastapi not installed")
+@pytest.mark.parametrize(
+    ("prefix", "expected_loc"),
+    [
+        (None, ("name",)),
+        ("body", ("body", "name")),
+        (("body", "data"), ("body", "data", "name")),
+    ],
+)
+@pytest.mark.asyncio
+async def test_fastapi_request_validation_error_prefix(prefix, expected_loc):
+    instance = SomethingModel(name="invalid")
+    with pytest.raises(RequestValidationError) as O_o:
+        with ensure_request_validation_errors(prefix):
+            await instance.model_async_validate()
+
+    assert O_o.value.errors()[0]["loc"] == expected_loc
+
+
+@pytest.mark.skipif(fastapi is None, reason="fastapi not installed")
+@pytest.mark.asyncio
+async def test_fastapi_minimal_request_validation_errors():
+    instance = SomethingModel(name="invalid")
+    with pytest.raises(RequestValidationError) as O_o:
+        with ensure_request_validation_errors("body", minimal=True):
+            await instance.model_async_validate()
+
+    assert O_o.value.errors() == [
+        {
+            "type": "value_error",
+            "loc": ("body", "name"),
+            "msg": "Invalid name",
+        },
+    ]
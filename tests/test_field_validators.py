@@ -1,11 +1,23 @@
-from typing import Any
+import asyncio
+import collections.abc
+import gc
+import typing
+from typing import Any, Optional
 
 import pydantic
 import pytest
 from pydantic.errors import PydanticUserError
+from pydantic_core import PydanticCustomError
 
-from pydantic_async_validation import AsyncValidationModelMixin, async_field_validator
-from pydantic_async_validation.validators import ValidationInfo
+from pydantic_async_validation import (
+    AsyncValidationModelMixin,
+    async_field_validator,
+    async_model_validator,
+    mixins,
+)
+from pydantic_async_validation.constants import ASYNC_CHILD_KIND_ANY
+from pydantic_async_validation.metaclasses import _get_child_kind
+from pydantic_async_validation.validators import EMPTY_EXTRA, ValidationInfo
 
 
 class SomethingModel(AsyncValidationModelMixin, pydantic.BaseModel):
@@ -45,95 +57,121 @@ async def test_async_validation_raises_when_validation_fails_by_assertion():
         await instance.model_async_validate()
 
 
+class ModelWithAllValidatorCombinations(AsyncValidationModelMixin, pydantic.BaseModel):
+    name: str
+
+    @async_field_validator('name')
+    async def validate_name_1(self) -> None: pass
+
+    @async_field_validator('name')
+    async def validate_name_2(self, value: str) -> None: pass
+
+    @async_field_validator('name')
+    async def validate_name_3(self, field: str) -> None: pass
+
+    @async_field_validator('name')
+    async def validate_name_4(self, value: str, field: str) -> None: pass
+
+    @async_field_validator('name')
+    async def validate_name_5(self, config: ValidationInfo) -> None: pass
+
+    @async_field_validator('name')
+    async def validate_name_6(self, value: str, config: ValidationInfo) -> None: pass
+
+    @async_field_validator('name')
+    async def validate_name_7(self, field: str, config: ValidationInfo) -> None: pass
+
+    @async_field_validator('name')
+    async def validate_name_8(self, value: str, field: str, config: ValidationInfo) -> None: pass
+
+    @async_field_validator('name')
+    async def validate_name_9(self, **kwargs) -> None: pass
+
+
 @pytest.mark.asyncio
 async def test_all_field_validator_combinations_are_valid():
-    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
-        name: str
+    instance = ModelWithAllValidatorCombinations(name="valid")
+    await instance.model_async_validate()
 
-        @async_field_validator('name')
-        async def validate_name_1(self) -> None: pass
 
-        @async_field_validator('name')
-        async def validate_name_2(self, value: str) -> None: pass
+def make_model_using_bare_validator():
+    class OtherModel1(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
 
-        @async_field_validator('name')
-        async def validate_name_3(self, field: str) -> None: pass
+        @async_field_validator
+        async def validate_name(self, no_value: Any) -> None: pass
 
-        @async_field_validator('name')
-        async def validate_name_4(self, value: str, field: str) -> None: pass
 
-        @async_field_validator('name')
-        async def validate_name_5(self, config: ValidationInfo) -> None: pass
+def make_model_using_unknown_argument():
+    class OtherModel2(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
 
         @async_field_validator('name')
-        async def validate_name_6(self, value: str, config: ValidationInfo) -> None: pass
+        async def validate_name(self, no_value: Any) -> None: pass
 
-        @async_field_validator('name')
-        async def validate_name_7(self, field: str, config: ValidationInfo) -> None: pass
 
-        @async_field_validator('name')
-        async def validate_name_8(self, value: str, field: str, config: ValidationInfo) -> None: pass
+def make_model_using_additional_argument():
+    class OtherModel3(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
 
         @async_field_validator('name')
-        async def validate_name_9(self, **kwargs) -> None: pass
+        async def validate_name(self, value: str, something_else: Any) -> None: pass
 
-    instance = OtherModel(name="valid")
-    await instance.model_async_validate()
 
+def make_model_using_cls_argument():
+    class OtherModel4(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
 
-@pytest.mark.asyncio
-async def test_invalid_validators_are_prohibited():
+        @async_field_validator('name')
+        async def validate_name(cls, value: str) -> None: pass
+
+
+@pytest.mark.parametrize(
+    "make_model",
+    [
+        make_model_using_bare_validator,
+        make_model_using_unknown_argument,
+        make_model_using_additional_argument,
+        make_model_using_cls_argument,
+    ],
+)
+def test_invalid_validators_are_prohibited(make_model):
     with pytest.raises(PydanticUserError):
-        class OtherModel1(AsyncValidationModelMixin, pydantic.BaseModel):
-            name: str
+        make_model()
 
-            @async_field_validator
-            async def validate_name(self, no_value: Any) -> None: pass
 
+def test_validator_field_names_must_be_strings():
     with pytest.raises(PydanticUserError):
-        class OtherModel2(AsyncValidationModelMixin, pydantic.BaseModel):
-            name: str
-
-            @async_field_validator('name')
-            async def validate_name(self, no_value: Any) -> None: pass
+        async_field_validator(['name'])  # type: ignore
 
     with pytest.raises(PydanticUserError):
-        class OtherModel3(AsyncValidationModelMixin, pydantic.BaseModel):
-            name: str
+        async_field_validator('name', 1)  # type: ignore
 
-            @async_field_validator('name')
-            async def validate_name(self, value: str, something_else: Any) -> None: pass
 
-    with pytest.raises(PydanticUserError):
-        class OtherModel4(AsyncValidationModelMixin, pydantic.BaseModel):
-            name: str
+class ModelWithExtraDetails(AsyncValidationModelMixin, pydantic.BaseModel):
+    name: str
 
-            @async_field_validator('name')
-            async def validate_name(cls, value: str) -> None: pass
+    @async_field_validator('name', some="thing")
+    async def validate_name(self, config: ValidationInfo) -> None:
+        assert config.extra == {"some": "thing"}
 
 
 @pytest.mark.asyncio
 async def test_async_validation_may_get_extra_details():
-    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
-        name: str
+    instance = ModelWithExtraDetails(name="valid")
+    await instance.model_async_validate()
 
-        @async_field_validator('name', some="thing")
-        async def validate_name(self, config: ValidationInfo) -> None:
-            assert config.extra == {"some": "thing"}
 
-    instance = OtherModel(name="valid")
-    await instance.model_async_validate()
+class ModelWithSubModels(AsyncValidationModelMixin, pydantic.BaseModel):
+    something: SomethingModel
+    something_list: list[SomethingModel]
+    something_tuple: tuple[SomethingModel]
+    somethings_by_name: dict[str, SomethingModel]
 
 
 @pytest.mark.asyncio
 async def test_async_validation_will_call_sub_model_validation():
-    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
-        something: SomethingModel
-        something_list: list[SomethingModel]
-        something_tuple: tuple[SomethingModel]
-        somethings_by_name: dict[str, SomethingModel]
-
-    instance = OtherModel(
+    instance = ModelWithSubModels(
         something=SomethingModel(name="invalid", age=1),
         something_list=[SomethingModel(name="invalid", age=1)],
         something_tuple=(SomethingModel(name="invalid", age=1),),
@@ -149,3 +187,433 @@ async def test_async_validation_will_call_sub_model_validation():
         ('something_tuple', 0, 'name'),
         ('somethings_by_name', 'some', 'name'),
     }
+
+
+@pytest.mark.asyncio
+async def test_async_validation_of_independent_models_may_run_concurrently():
+    instances = [
+        SomethingModel(name="invalid" if index % 2 else "valid", age=1)
+        for index
+        in range(100)
+    ]
+    results = await asyncio.gather(
+        *(instance.model_async_validate() for instance in instances),
+        return_exceptions=True,
+    )
+
+    assert results[::2] == [None] * 50
+    for result in results[1::2]:
+        assert isinstance(result, pydantic.ValidationError)
+        assert result.errors()[0]['loc'] == ('name',)
+
+
+@pytest.mark.asyncio
+async def test_async_validation_handles_sync_validators_raising_errors(recwarn):
+    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
+        a: str
+        b: str
+
+        @async_field_validator('a')
+        async def validate_a(self, value: str) -> None: pass
+
+        @async_field_validator('b')
+        def validate_b(self) -> None:
+            raise ValueError('sync bad')
+
+        @async_model_validator()
+        def validate_model(self) -> None:
+            raise ValueError('sync model bad')
+
+    instance = OtherModel(a="valid", b="valid")
+    with pytest.raises(pydantic.ValidationError) as O_o:
+        await instance.model_async_validate()
+
+    assert [(e['loc'], e['msg']) for e in O_o.value.errors()] == [
+        (('b',), 'sync bad'),
+        (('__root__',), 'sync model bad'),
+    ]
+
+    gc.collect()
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+
+@pytest.mark.asyncio
+async def test_async_validation_runs_validators_concurrently():
+    running = []
+    max_running = []
+
+    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
+        other_name: str
+
+        @async_field_validator('name', 'other_name')
+        async def validate_name(self, field: str) -> None:
+            running.append(field)
+            max_running.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(field)
+
+    instance = OtherModel(name="valid", other_name="valid")
+    await instance.model_async_validate()
+
+    assert max(max_running) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_validation_may_run_validators_sequentially():
+    running = []
+    max_running = []
+
+    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
+        pydantic_model_async_validate_sequential = True
+
+        name: str
+        other_name: str
+
+        @async_field_validator('name', 'other_name')
+        async def validate_name(self, value: str, field: str) -> None:
+            running.append(field)
+            max_running.append(len(running))
+            await asyncio.sleep(0)
+            running.remove(field)
+            assert value == "valid"
+
+    instance = OtherModel(name="valid", other_name="valid")
+    await instance.model_async_validate()
+
+    assert max(max_running) == 1
+
+    instance = OtherModel(name="invalid", other_name="invalid")
+    with pytest.raises(pydantic.ValidationError) as O_o:
+        await instance.model_async_validate()
+
+    assert [e['loc'] for e in O_o.value.errors()] == [('name',), ('other_name',)]
+
+
+@pytest.mark.asyncio
+async def test_async_validation_error_contains_details():
+    instance = SomethingModel(name="invalid", age=1)
+    with pytest.raises(pydantic.ValidationError) as O_o:
+        await instance.model_async_validate()
+
+    assert O_o.value.errors(include_url=False) == [
+        {
+            'type': 'value_error',
+            'loc': ('name',),
+            'msg': 'Invalid name',
+            'input': 'invalid',
+        },
+    ]
+
+
+class ModelWithOptionalChildren(AsyncValidationModelMixin, pydantic.BaseModel):
+    name: str
+    age: int = 1
+    something: Optional[SomethingModel] = None
+    somethings: Optional[list[SomethingModel]] = None
+    anything: Any = None
+    parent: Optional['ModelWithOptionalChildren'] = None
+
+
+def test_child_validation_plan_only_contains_possible_children():
+    assert dict(ModelWithOptionalChildren.pydantic_model_async_child_validation_plan) == {
+        'something': 'model',
+        'somethings': 'sequence',
+        'anything': 'any',
+        'parent': 'model',
+    }
+
+
+@pytest.mark.asyncio
+async def test_async_validation_will_call_optional_sub_model_validation():
+    instance = ModelWithOptionalChildren(
+        name="valid",
+        anything=[SomethingModel(name="invalid", age=1)],
+        parent=ModelWithOptionalChildren(
+            name="valid",
+            something=SomethingModel(name="invalid", age=1),
+        ),
+    )
+    with pytest.raises(pydantic.ValidationError) as O_o:
+        await instance.model_async_validate()
+
+    assert {e['loc'] for e in O_o.value.errors()} == {
+        ('anything', 0, 'name'),
+        ('parent', 'something', 'name'),
+    }
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        typing.List,  # noqa: UP006
+        typing.Tuple,  # noqa: UP006
+        typing.Sequence,
+        typing.Dict,  # noqa: UP006
+        Optional[typing.Dict],  # noqa: UP006
+        typing.DefaultDict,  # noqa: UP006
+        typing.OrderedDict,
+        typing.Mapping,
+        collections.abc.Mapping,
+        collections.abc.Sequence,
+    ],
+)
+def test_bare_containers_may_contain_any_children(annotation):
+    assert _get_child_kind(annotation) == ASYNC_CHILD_KIND_ANY
+
+
+@pytest.mark.parametrize(
+    ("annotation", "value", "expected_loc"),
+    [
+        (typing.List, [SomethingModel(name="invalid", age=1)], ('x', 0, 'name')),  # noqa: UP006
+        (typing.Tuple, (SomethingModel(name="invalid", age=1),), ('x', 0, 'name')),  # noqa: UP006
+        (typing.Sequence, [SomethingModel(name="invalid", age=1)], ('x', 0, 'name')),
+        (collections.abc.Sequence, [SomethingModel(name="invalid", age=1)], ('x', 0, 'name')),
+        (typing.Dict, {"a": SomethingModel(name="invalid", age=1)}, ('x', 'a', 'name')),  # noqa: UP006
+        (Optional[typing.Dict], {"a": SomethingModel(name="invalid", age=1)}, ('x', 'a', 'name')),  # noqa: UP006
+        (typing.OrderedDict, {"a": SomethingModel(name="invalid", age=1)}, ('x', 'a', 'name')),
+        (typing.Mapping, {"a": SomethingModel(name="invalid", age=1)}, ('x', 'a', 'name')),
+        (collections.abc.Mapping, {"a": SomethingModel(name="invalid", age=1)}, ('x', 'a', 'name')),
+    ],
+)
+@pytest.mark.asyncio
+async def test_async_validation_will_call_sub_model_validation_for_bare_containers(
+    annotation,
+    value,
+    expected_loc,
+):
+    OtherModel = pydantic.create_model(
+        'OtherModel',
+        __base__=AsyncValidationModelMixin,
+        x=(annotation, ...),
+    )
+
+    instance = OtherModel(x=value)
+    with pytest.raises(pydantic.ValidationError) as O_o:
+        await instance.model_async_validate()
+
+    assert [e['loc'] for e in O_o.value.errors()] == [expected_loc]
+
+
+@pytest.mark.asyncio
+async def test_async_validation_may_return_errors():
+    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
+
+        @async_field_validator('name', raises_on_error=False)
+        async def validate_name(self, value: str) -> Optional[str]:
+            if value == "invalid":
+                return "Invalid name"
+            return None
+
+    instance = OtherModel(name="valid")
+    await instance.model_async_validate()
+
+    instance = OtherModel(name="invalid")
+    with pytest.raises(pydantic.ValidationError) as O_o:
+        await instance.model_async_validate()
+
+    assert O_o.value.errors()[0]['loc'] == ('name',)
+    assert O_o.value.errors()[0]['msg'] == 'Invalid name'
+
+
+def test_validators_are_stored_as_tuples():
+    assert isinstance(SomethingModel.pydantic_model_async_field_validators, tuple)
+    assert isinstance(SomethingModel.pydantic_model_async_model_validators, tuple)
+    assert [
+        field_names
+        for field_names, _
+        in SomethingModel.pydantic_model_async_field_validators
+    ] == [('name',), ('age',)]
+
+
+def test_field_validator_calls_are_flattened():
+    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
+        other_name: str
+
+        @async_field_validator('name', 'other_name')
+        async def validate_name(self) -> None: pass
+
+    assert [
+        field_name
+        for field_name, _
+        in OtherModel.pydantic_model_async_field_validator_calls
+    ] == ['name', 'other_name']
+
+
+class FieldName(str):
+    def __repr__(self) -> str:
+        return "undefined_name"
+
+
+def test_field_validator_tasks_do_not_use_field_name_repr():
+    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
+
+        @async_field_validator(FieldName('name'))
+        async def validate_name(self, value: str) -> None: pass
+
+    instance = OtherModel(name="valid")
+    tasks = OtherModel.pydantic_model_async_field_validator_tasks(instance)
+    try:
+        assert [
+            (field_name, field_value)
+            for field_name, field_value, _, _
+            in tasks
+        ] == [('name', 'valid')]
+        assert type(tasks[0][0]) is str
+    finally:
+        for _, _, _, coroutine in tasks:
+            coroutine.close()
+
+
+def test_field_validator_tasks_are_created_for_all_calls():
+    class OtherModel(SomethingModel):
+        pass
+
+    instance = OtherModel(name="valid", age=1)
+    tasks = OtherModel.pydantic_model_async_field_validator_tasks(instance)
+    try:
+        assert [
+            (field_name, field_value)
+            for field_name, field_value, _, _
+            in tasks
+        ] == [('name', 'valid'), ('age', 1)]
+    finally:
+        for _, _, _, coroutine in tasks:
+            coroutine.close()
+
+
+@pytest.mark.asyncio
+async def test_field_validators_get_passed_arguments():
+    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
+
+        @async_field_validator('name', some="thing")
+        async def validate_name_1(self, value: str, field: str, config: ValidationInfo) -> None:
+            assert value == "valid"
+            assert field == "name"
+            assert config.extra == {"some": "thing"}
+
+        @async_field_validator('name')
+        async def validate_name_2(self, **kwargs) -> None:
+            assert set(kwargs.keys()) == {"value", "field", "config"}
+            assert kwargs["value"] == "valid"
+
+        @async_field_validator('name')
+        async def validate_name_3(self, value: str, **kwargs) -> None:
+            assert value == "valid"
+            assert set(kwargs.keys()) == {"field", "config"}
+
+        @async_field_validator('name')
+        async def validate_name_4(self, field: str, value: str, /) -> None:
+            assert value == "valid"
+            assert field == "name"
+
+        @async_field_validator('name')
+        async def validate_name_5(self, *, config: ValidationInfo, value: str) -> None:
+            assert value == "valid"
+            assert isinstance(config, ValidationInfo)
+
+    instance = OtherModel(name="valid")
+    await instance.model_async_validate()
+
+
+def test_field_validator_wrapper_keeps_name():
+    _, validator = SomethingModel.pydantic_model_async_field_validator_calls[0]
+    assert validator.func.__name__ == 'validate_name'
+    assert validator.func.__qualname__ == 'SomethingModel.validate_name'
+    assert not hasattr(validator.func, '__wrapped__')
+
+
+@pytest.mark.asyncio
+async def test_sub_model_errors_keep_details():
+    instance = ModelWithOptionalChildren(
+        name="valid",
+        parent=ModelWithOptionalChildren(
+            name="valid",
+            somethings=[SomethingModel(name="invalid", age=1)],
+        ),
+    )
+    with pytest.raises(pydantic.ValidationError) as O_o:
+        await instance.model_async_validate()
+
+    assert O_o.value.errors(include_url=False) == [
+        {
+            'type': 'value_error',
+            'loc': ('parent', 'somethings', 0, 'name'),
+            'msg': 'Invalid name',
+            'input': 'invalid',
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sub_model_errors_are_prefixed_for_custom_validation():
+    class CustomValidationModel(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
+
+        async def model_async_validate(self) -> None:
+            raise pydantic.ValidationError.from_exception_data(
+                self.__class__.__name__,
+                [{
+                    'type': PydanticCustomError('value_error', 'Custom error'),
+                    'loc': ('name',),
+                    'input': self.name,
+                }],
+            )
+
+    class ParentModel(AsyncValidationModelMixin, pydantic.BaseModel):
+        child: CustomValidationModel
+
+    instance = ParentModel(child=CustomValidationModel(name="valid"))
+    with pytest.raises(pydantic.ValidationError) as O_o:
+        await instance.model_async_validate()
+
+    assert O_o.value.errors(include_url=False) == [
+        {
+            'type': 'value_error',
+            'loc': ('child', 'name'),
+            'msg': 'Custom error',
+            'input': 'valid',
+        },
+    ]
+
+
+class ModelWithoutValidation(AsyncValidationModelMixin, pydantic.BaseModel):
+    name: str
+
+
+class ModelWithChildrenWithoutValidation(AsyncValidationModelMixin, pydantic.BaseModel):
+    children: list[ModelWithoutValidation]
+
+
+@pytest.mark.asyncio
+async def test_children_without_validation_are_skipped(monkeypatch):
+    validated_prefixes = []
+    child_validation_errors = mixins._child_validation_errors
+
+    async def record_child_validation(prefix, instance):
+        validated_prefixes.append(prefix)
+        return await child_validation_errors(prefix, instance)
+
+    monkeypatch.setattr(mixins, '_child_validation_errors', record_child_validation)
+
+    assert ModelWithoutValidation.pydantic_model_async_has_validation is False
+    assert ModelWithChildrenWithoutValidation.pydantic_model_async_has_validation is True
+
+    instance = ModelWithChildrenWithoutValidation(children=[ModelWithoutValidation(name="valid")])
+    await instance.model_async_validate()
+
+    assert validated_prefixes == []
+
+
+def test_validators_without_extra_details_get_empty_dict():
+    for _, validator in SomethingModel.pydantic_model_async_field_validator_calls:
+        assert validator.extra == {}
+        assert type(validator.extra) is dict
+
+
+def test_validation_info_defaults_to_empty_extra():
+    assert ValidationInfo(lambda: None).extra is EMPTY_EXTRA
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 
 import pydantic
 import pytest
@@ -42,62 +42,76 @@ async def test_async_validation_raises_when_validation_fails_by_assertion():
         await instance.model_async_validate()
 
 
+class ModelWithAllValidatorCombinations(AsyncValidationModelMixin, pydantic.BaseModel):
+    name: str
+
+    @async_model_validator()
+    async def validate_name_1(self) -> None: pass
+
+    @async_model_validator()
+    async def validate_name_2(self, config: ValidationInfo) -> None: pass
+
+    @async_model_validator()
+    async def validate_name_3(self, **kwargs) -> None: pass
+
+
 @pytest.mark.asyncio
 async def test_all_field_validator_combinations_are_valid():
-    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
+    instance = ModelWithAllValidatorCombinations(name="valid")
+    await instance.model_async_validate()
+
+
+def make_model_using_unknown_argument():
+    class OtherModel1(AsyncValidationModelMixin, pydantic.BaseModel):
         name: str
 
         @async_model_validator()
-        async def validate_name_1(self) -> None: pass
+        async def validate_name(self, uses_value_or_anything: Any) -> None: pass
 
-        @async_model_validator()
-        async def validate_name_2(self, config: ValidationInfo) -> None: pass
 
-        @async_model_validator()
-        async def validate_name_3(self, **kwargs) -> None: pass
+def make_model_using_cls_argument():
+    class OtherModel2(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
 
-    instance = OtherModel(name="valid")
-    await instance.model_async_validate()
+        @async_model_validator()
+        async def validate_name(cls) -> None: pass
 
 
-@pytest.mark.asyncio
-async def test_invalid_validators_are_prohibited():
+@pytest.mark.parametrize(
+    "make_model",
+    [
+        make_model_using_unknown_argument,
+        make_model_using_cls_argument,
+    ],
+)
+def test_invalid_validators_are_prohibited(make_model):
     with pytest.raises(PydanticUserError):
-        class OtherModel1(AsyncValidationModelMixin, pydantic.BaseModel):
-            name: str
+        make_model()
 
-            @async_model_validator()
-            async def validate_name(self, uses_value_or_anything: Any) -> None: pass
 
-    with pytest.raises(PydanticUserError):
-        class OtherModel2(AsyncValidationModelMixin, pydantic.BaseModel):
-            name: str
+class ModelWithExtraDetails(AsyncValidationModelMixin, pydantic.BaseModel):
+    name: str
 
-            @async_model_validator()
-            async def validate_name(cls) -> None: pass
+    @async_model_validator(some="thing")
+    async def validate_name(self, config: ValidationInfo) -> None:
+        assert config.extra == {"some": "thing"}
 
 
 @pytest.mark.asyncio
 async def test_async_validation_may_get_extra_details():
-    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
-        name: str
+    instance = ModelWithExtraDetails(name="valid")
+    await instance.model_async_validate()
 
-        @async_model_validator(some="thing")
-        async def validate_name(self, config: ValidationInfo) -> None:
-            assert config.extra == {"some": "thing"}
 
-    instance = OtherModel(name="valid")
-    await instance.model_async_validate()
+class ModelWithSubModels(AsyncValidationModelMixin, pydantic.BaseModel):
+    something: SomethingModel
+    somethings: list[SomethingModel]
+    somethings_by_name: dict[str, SomethingModel]
 
 
 @pytest.mark.asyncio
 async def test_async_validation_will_call_sub_model_validation():
-    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
-        something: SomethingModel
-        somethings: list[SomethingModel]
-        somethings_by_name: dict[str, SomethingModel]
-
-    instance = OtherModel(
+    instance = ModelWithSubModels(
         something=SomethingModel(name="invalid", age=1),
         somethings=[SomethingModel(name="invalid", age=1)],
         somethings_by_name={"some": SomethingModel(name="invalid", age=1)},
@@ -111,3 +125,71 @@ async def test_async_validation_will_call_sub_model_validation():
         ('somethings', 0, '__root__'),
         ('somethings_by_name', 'some', '__root__'),
     }
+
+
+class InheritingModel(SomethingModel):
+    pass
+
+
+class InheritingModelWithAdditionalValidator(SomethingModel):
+    @async_model_validator()
+    async def validate_age_is_adult(self) -> None:
+        assert self.age > 1
+
+
+@pytest.mark.parametrize(
+    ("cls", "additional_error_count"),
+    [
+        (SomethingModel, 0),
+        (InheritingModel, 0),
+        (InheritingModelWithAdditionalValidator, 1),
+    ],
+)
+@pytest.mark.parametrize(
+    ("error_count", "instance_data"),
+    [
+        (0, {"name": "valid", "age": 1}),
+        (1, {"name": "invalid", "age": 1}),
+        (1, {"name": "valid", "age": 0}),
+        (2, {"name": "invalid", "age": 0}),
+    ],
+)
+@pytest.mark.asyncio
+async def test_async_validation_inherits_validators(cls, additional_error_count, error_count, instance_data):
+    instance = cls(**instance_data)
+    expected_error_count = error_count + additional_error_count
+    if not expected_error_count:
+        await instance.model_async_validate()
+        return
+
+    with pytest.raises(pydantic.ValidationError) as O_o:
+        await instance.model_async_validate()
+
+    assert len(O_o.value.errors()) == expected_error_count
+
+
+def test_inherited_validators_are_extended():
+    assert len(InheritingModel.pydantic_model_async_model_validators) == 2
+    assert len(InheritingModelWithAdditionalValidator.pydantic_model_async_model_validators) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_validation_may_return_errors():
+    class OtherModel(AsyncValidationModelMixin, pydantic.BaseModel):
+        name: str
+
+        @async_model_validator(raises_on_error=False)
+        async def validate_name(self) -> Optional[str]:
+            if self.name == "invalid":
+                return "Invalid name"
+            return None
+
+    instance = OtherModel(name="valid")
+    await instance.model_async_validate()
+
+    instance = OtherModel(name="invalid")
+    with pytest.raises(pydantic.ValidationError) as O_o:
+        await instance.model_async_validate()
+
+    assert O_o.value.errors()[0]['loc'] == ('__root__',)
+    assert O_o.value.errors()[0]['msg'] == 'Invalid name'